@@ -3,3 +3,5 @@ repo_to_prompt package.
 
 This package provides utilities to parse a repository into a prompt format.
 """
+
+__version__ = "0.1.0"
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Copyright 2025 by Sergei Belousov
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable, Optional
+
+from repo_to_prompt import __version__
+
+
+def _cache_home() -> str:
+    """
+    Return the base cache directory.
+
+    Per the XDG spec, XDG_CACHE_HOME is only honoured when it is an absolute
+    path; empty or relative values fall back to ~/.cache.
+
+    Returns:
+        str: The base cache directory.
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home and os.path.isabs(xdg_cache_home):
+        return xdg_cache_home
+    return os.path.join(os.path.expanduser("~"), ".cache")
+
+
+CACHE_DIR = os.path.join(_cache_home(), "repo_to_prompt")
+
+# Bump whenever the cached output format changes so stale entries are ignored.
+CACHE_VERSION = 3
+
+# Set this environment variable to a non-empty value to disable the cache.
+NO_CACHE_ENV = "REPO_TO_PROMPT_NO_CACHE"
+
+
+def is_enabled() -> bool:
+    """
+    Check whether the on-disk cache is enabled.
+
+    The setting is read from the environment on each call, so it also reaches
+    worker processes.
+
+    Returns:
+        bool: False if REPO_TO_PROMPT_NO_CACHE is set to a non-empty value.
+    """
+    return not os.environ.get(NO_CACHE_ENV)
+
+
+def cache_key(code: str) -> str:
+    """
+    Compute the cache key for a piece of source code.
+
+    The key covers the source itself, the interpreter version (the AST layout
+    differs between Python releases), the package version and the cache version
+    (the output format may change between releases).
+
+    Args:
+        code (str): The source code.
+
+    Returns:
+        str: Hex digest identifying the cache entry.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version_info[:3]}:{__version__}:{CACHE_VERSION}:".encode())
+    digest.update(code.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+def load(key: str) -> Optional[str]:
+    """
+    Load a cached value.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        Optional[str]: The cached value, or None on a miss or unreadable entry.
+    """
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.pkl"), "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def store(key: str, value: str) -> None:
+    """
+    Store a value in the cache. Failures (e.g. read-only home) are ignored.
+
+    Args:
+        key (str): The cache key.
+        value (str): The value to store.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file and rename so concurrent runs never observe
+        # a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.pkl"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+
+
+def cache_from_file(func: Callable[[str], str]) -> Callable[[str], str]:
+    """
+    Decorator caching the result of a ``str -> str`` function on disk, keyed
+    by the SHA256 of its argument. Does nothing when the cache is disabled.
+
+    Args:
+        func (Callable[[str], str]): The function to wrap.
+
+    Returns:
+        Callable[[str], str]: The wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(code: str) -> str:
+        if not is_enabled():
+            return func(code)
+        key = cache_key(code)
+        cached = load(key)
+        if cached is not None:
+            return cached
+        result = func(code)
+        store(key, result)
+        return result
+
+    return wrapper
@@ -22,8 +22,54 @@ import subprocess
 import sys
 import tempfile
 
+from repo_to_prompt import ast_cache
 from repo_to_prompt.folder_parser import FolderParser
 
+# Oldest git release with reliable partial clone (--filter) support.
+MIN_PARTIAL_CLONE_GIT = (2, 27)
+
+
+def _git_version() -> tuple:
+    """
+    Return the installed git version as a tuple of ints, or () if unknown.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+    except OSError:
+        return ()
+    # Output looks like "git version 2.39.2" (possibly with a vendor suffix).
+    parts = result.stdout.split()
+    if len(parts) < 3:
+        return ()
+    version = []
+    for part in parts[2].split("."):
+        if not part.isdigit():
+            break
+        version.append(int(part))
+    return tuple(version)
+
+
+def build_clone_cmd(url: str, target_dir: str) -> list:
+    """
+    Build the git clone command for a repository URL.
+
+    Only the working tree of the tip commit is needed, so a shallow, single-branch
+    clone is used; blobs are filtered out when git supports partial clone.
+
+    Args:
+        url (str): The git repository URL.
+        target_dir (str): Directory to clone into.
+
+    Returns:
+        list: The command line arguments.
+    """
+    clone_cmd = ["git", "clone", "--depth", "1", "--single-branch"]
+    if _git_version() >= MIN_PARTIAL_CLONE_GIT:
+        clone_cmd.append("--filter=blob:none")
+    return clone_cmd + [url, target_dir]
+
 
 def main() -> None:
     """Main function for the CLI tool."""
@@ -49,28 +95,51 @@ def main() -> None:
         action="store_true",
         help="Extract only interfaces (without implementation) for all *.py files.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of worker processes used to extract interfaces "
+            "(default: number of CPUs; 1 disables the process pool)."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk interface cache.",
+    )
     args = parser.parse_args()
+    if args.no_cache:
+        # Set through the environment so worker processes see it too.
+        os.environ[ast_cache.NO_CACHE_ENV] = "1"
 
     # Determine if the provided path is a local directory or a git repository URL.
     if os.path.isdir(args.path):
         repo_path = args.path
-        folder_parser = FolderParser(repo_path, interfaces_only=args.interfaces_only)
-        print(folder_parser.dump_to_string())
+        folder_parser = FolderParser(
+            repo_path, interfaces_only=args.interfaces_only, max_workers=args.jobs
+        )
+        sys.stdout.writelines(folder_parser.iter_dump())
+        sys.stdout.write("\n")
     else:
         # Clone the git repository into a temporary directory.
         with tempfile.TemporaryDirectory() as temp_dir:
             logging.info(
                 f"Cloning git repository {args.path} to temporary directory {temp_dir}..."
             )
-            clone_cmd = ["git", "clone", args.path, temp_dir]
+            clone_cmd = build_clone_cmd(args.path, temp_dir)
             result = subprocess.run(
                 clone_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
             )
             if result.returncode != 0:
                 logging.error(f"Git clone failed: {result.stderr}")
                 sys.exit(1)
-            folder_parser = FolderParser(temp_dir, interfaces_only=args.interfaces_only)
-            print(folder_parser.dump_to_string())
+            folder_parser = FolderParser(
+                temp_dir, interfaces_only=args.interfaces_only, max_workers=args.jobs
+            )
+            sys.stdout.writelines(folder_parser.iter_dump())
+            sys.stdout.write("\n")
             # The temporary directory is automatically removed here.
 
 
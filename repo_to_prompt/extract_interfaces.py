@@ -16,150 +16,175 @@ limitations under the License.
 """
 
 import ast
+import functools
 import textwrap
 
+from repo_to_prompt.ast_cache import cache_from_file
 
-def extract_interfaces(code: str) -> str:
+INDENT = " " * 4  # Standard indent (4 spaces)
+
+
+def get_docstring(node) -> str:
+    """Return the raw docstring from the node or an empty string."""
+    raw = ast.get_docstring(node, clean=False)
+    return raw if raw else ""
+
+
+def format_docstring(docstring: str, indent_level: int) -> str:
     """
-    Extract class and function declarations (including methods), annotated fields,
-    docstrings, and comments (if applicable) from Python code without including the
-    implementation bodies. Returns a string with these declarations.
+    Format the docstring with proper indentation.
+    """
+    if not docstring:
+        return ""
+    dedented = textwrap.dedent(docstring)
+    indent = INDENT * indent_level
+    return f'{indent}"""\n' + textwrap.indent(dedented, indent) + "\n" + indent + '"""'
+
+
+def unparse_simple(node: ast.AST) -> str:
+    """
+    Unparse an expression, formatting plain names and dotted names
+    (e.g. 'property', 'app.route') directly instead of through ast.unparse.
     """
-    # Parse the source code into an AST.
-    tree = ast.parse(code)
-    INDENT = " " * 4  # Standard indent (4 spaces)
-    lines = []  # List of lines to build the result
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return f"{node.value.id}.{node.attr}"
+    return ast.unparse(node)
 
-    def get_docstring(node) -> str:
-        """Return the raw docstring from the node or an empty string."""
-        raw = ast.get_docstring(node, clean=False)
-        return raw if raw else ""
 
-    def format_docstring(docstring: str, indent_level: int) -> str:
+def format_decorators(node: ast.AST, indent_level: int) -> str:
+    """
+    Return a string of decorators for a class/function/method.
+    """
+    if not hasattr(node, "decorator_list") or not node.decorator_list:
+        return ""
+    decorators = []
+    indent = INDENT * indent_level
+    for decorator in node.decorator_list:
+        dec_str = unparse_simple(decorator)
+        decorators.append(f"{indent}@{dec_str}")
+    return "\n".join(decorators)
+
+
+def format_function_signature(func_node: ast.FunctionDef, indent_level: int) -> str:
+    """
+    Format the function signature (e.g., 'def name(args):') preserving annotations.
+    """
+    indent = INDENT * indent_level
+    keyword = "async def" if isinstance(func_node, ast.AsyncFunctionDef) else "def"
+    type_params = getattr(func_node, "type_params", None)
+    type_params_str = ""
+    if type_params:
+        type_params_str = "[" + ", ".join(ast.unparse(p) for p in type_params) + "]"
+    signature = f"{keyword} {func_node.name}{type_params_str}({ast.unparse(func_node.args)})"
+    if func_node.returns is not None:
+        signature += f" -> {ast.unparse(func_node.returns)}"
+    return f"{indent}{signature}:"
+
+
+def format_class_signature(class_node: ast.ClassDef, indent_level: int) -> str:
+    """
+    Format the class signature (e.g., 'class MyClass(Base1, Base2):').
+    """
+    indent = INDENT * indent_level
+    bases_str = ""
+    if class_node.bases:
+        bases = [unparse_simple(base) for base in class_node.bases]
+        bases_str = "(" + ", ".join(bases) + ")"
+    return f"{indent}class {class_node.name}{bases_str}:"
+
+
+class InterfaceExtractor(ast.NodeVisitor):
+    """
+    Collects interface declarations from a module AST.
+
+    Only module and class bodies are descended into; function bodies and any
+    other statements are skipped.
+    """
+
+    def __init__(self) -> None:
         """
-        Format the docstring with proper indentation.
+        Initialize an empty extractor at the top indentation level.
         """
-        if not docstring:
-            return ""
-        dedented = textwrap.dedent(docstring)
-        indent = INDENT * indent_level
-        return f'{indent}"""\n' + textwrap.indent(dedented, indent) + "\n" + indent + '"""'
+        self.lines = []
+        self.indent = 0
 
-    def format_decorators(node: ast.AST, indent_level: int) -> str:
+    def visit_Module(self, node: ast.Module) -> None:
+        """
+        Process module-level statements.
         """
-        Return a string of decorators for a class/function/method.
+        for child in node.body:
+            self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
-        if not hasattr(node, "decorator_list") or not node.decorator_list:
-            return ""
-        decorators = []
-        indent = INDENT * indent_level
-        for decorator in node.decorator_list:
-            dec_str = ast.unparse(decorator).strip()
-            decorators.append(f"{indent}@{dec_str}")
-        return "\n".join(decorators)
-
-    def format_function_signature(func_node: ast.FunctionDef, indent_level: int) -> str:
+        Emit the class signature and docstring, then process the class body.
+        """
+        decorators = format_decorators(node, self.indent)
+        if decorators:
+            self.lines.append(decorators)
+        self.lines.append(format_class_signature(node, self.indent))
+        self.indent += 1
+        class_doc = get_docstring(node)
+        if class_doc:
+            self.lines.append(format_docstring(class_doc, self.indent))
+        for child in node.body:
+            self.visit(child)
+        self.indent -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """
-        Format the function signature (e.g., 'def name(args):') preserving annotations.
+        Emit the function signature and docstring, skipping the implementation.
         """
-        indent = INDENT * indent_level
-        # Preserve only the docstring (if present) and remove other implementations.
-        body_copy = list(func_node.body)
-        new_body = []
-        if (
-            body_copy
-            and isinstance(body_copy[0], ast.Expr)
-            and isinstance(body_copy[0].value, ast.Constant)
-            and isinstance(body_copy[0].value.value, str)
-        ):
-            new_body = [body_copy[0]]
-        func_node.body = new_body
-
-        func_str = ast.unparse(func_node)
-        # Remove any docstring block from the unparsed output.
-        func_lines = func_str.splitlines()
-        new_lines = []
-        in_docstring = False
-        for line in func_lines:
-            if line.strip().startswith('"""') and not in_docstring:
-                in_docstring = True
-                continue
-            if in_docstring:
-                if line.strip().endswith('"""'):
-                    in_docstring = False
-                continue
-            new_lines.append(line)
-        signature_line = new_lines[0].strip()
-        if not signature_line.endswith(":"):
-            signature_line += ":"
-        return f"{indent}{signature_line}"
-
-    def format_class_signature(class_node: ast.ClassDef, indent_level: int) -> str:
+        decorators = format_decorators(node, self.indent)
+        if decorators:
+            self.lines.append(decorators)
+        self.lines.append(format_function_signature(node, self.indent))
+        func_doc = get_docstring(node)
+        if func_doc:
+            self.lines.append(format_docstring(func_doc, self.indent + 1))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         """
-        Format the class signature (e.g., 'class MyClass(Base1, Base2):').
+        Emit annotated fields (e.g., "title: str" or "title: str = value") of classes.
         """
-        indent = INDENT * indent_level
-        bases_str = ""
-        if class_node.bases:
-            bases = [ast.unparse(base) for base in class_node.bases]
-            bases_str = "(" + ", ".join(bases) + ")"
-        return f"{indent}class {class_node.name}{bases_str}:"
-
-    def process_body(nodes, indent_level: int) -> None:
+        if self.indent == 0:
+            # Module-level annotated assignments are not part of the interface.
+            return
+        target_code = ast.unparse(node.target)
+        ann_code = ast.unparse(node.annotation)
+        line = f"{INDENT * self.indent}{target_code}: {ann_code}"
+        if node.value is not None:
+            line += f" = {ast.unparse(node.value)}"
+        self.lines.append(line)
+
+    def generic_visit(self, node: ast.AST) -> None:
         """
-        Process a list of AST nodes (class body or module-level) and extract declarations.
+        Skip other node types.
         """
-        for node in nodes:
-            if isinstance(node, ast.AnnAssign):
-                # Process annotated fields (e.g., "title: str" or "title: str = value")
-                target_code = ast.unparse(node.target)
-                ann_code = ast.unparse(node.annotation)
-                if node.value is not None:
-                    value_code = ast.unparse(node.value)
-                    line = f"{INDENT * indent_level}{target_code}: {ann_code} = {value_code}"
-                else:
-                    line = f"{INDENT * indent_level}{target_code}: {ann_code}"
-                lines.append(line)
-            elif isinstance(node, ast.ClassDef):
-                decorators = format_decorators(node, indent_level)
-                if decorators:
-                    lines.append(decorators)
-                lines.append(format_class_signature(node, indent_level))
-                class_doc = get_docstring(node)
-                if class_doc:
-                    lines.append(format_docstring(class_doc, indent_level + 1))
-                process_body(node.body, indent_level + 1)
-            elif isinstance(node, ast.FunctionDef):
-                decorators = format_decorators(node, indent_level)
-                if decorators:
-                    lines.append(decorators)
-                lines.append(format_function_signature(node, indent_level))
-                func_doc = get_docstring(node)
-                if func_doc:
-                    lines.append(format_docstring(func_doc, indent_level + 1))
-            else:
-                # Skip other node types.
-                continue
-
-    for node in tree.body:
-        if isinstance(node, ast.ClassDef):
-            decorators = format_decorators(node, 0)
-            if decorators:
-                lines.append(decorators)
-            lines.append(format_class_signature(node, 0))
-            class_doc = get_docstring(node)
-            if class_doc:
-                lines.append(format_docstring(class_doc, 1))
-            process_body(node.body, 1)
-        elif isinstance(node, ast.FunctionDef):
-            decorators = format_decorators(node, 0)
-            if decorators:
-                lines.append(decorators)
-            lines.append(format_function_signature(node, 0))
-            func_doc = get_docstring(node)
-            if func_doc:
-                lines.append(format_docstring(func_doc, 1))
-        else:
-            continue
-
-    return "\n".join(lines)
+
+
+# Bounded, so long-lived library callers do not keep every source alive.
+@functools.lru_cache(maxsize=128)
+@cache_from_file
+def extract_interfaces(code: str) -> str:
+    """
+    Extract class and function declarations (including methods), annotated fields,
+    docstrings, and comments (if applicable) from Python code without including the
+    implementation bodies. Returns a string with these declarations, or the code
+    unchanged if it cannot be parsed.
+    """
+    # Parse the source code into an AST. Calling compile directly with
+    # dont_inherit=True skips ast.parse's wrapper and keeps this module's
+    # __future__ flags out of the parse.
+    try:
+        tree = compile(code, "<unknown>", "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    except (SyntaxError, ValueError):
+        # Malformed source (or null bytes): fall back to the file as-is.
+        return code
+    extractor = InterfaceExtractor()
+    extractor.visit(tree)
+    return "\n".join(extractor.lines)
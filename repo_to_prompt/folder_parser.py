@@ -15,12 +15,35 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
+import io
 import logging
 import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional
 
 from pathspec import PathSpec
 
+from repo_to_prompt import uring_reader
+from repo_to_prompt.extract_interfaces import extract_interfaces
+
+# Below this many files the cost of spawning worker processes outweighs the gain.
+PARALLEL_MIN_FILES = 32
+# Number of reader threads and of reads kept in flight ahead of the consumer.
+READ_WORKERS = 8
+READ_AHEAD = 16
+# Minimum number of files for which batched io_uring reads are worth setting up.
+URING_MIN_FILES = 64
+# Files larger than this are not included in the dump.
+MAX_FILE_SIZE = 1 << 20
+# Leading bytes inspected for NUL bytes when detecting binary content.
+BINARY_SNIFF_SIZE = 8192
+# Closes the code fence opened by a file header in the dump.
+FILE_FOOTER = "\n```\n"
+
 
 class IgnoreSpec:
     """
@@ -69,6 +92,19 @@ class IgnoreSpec:
             rel_path += "/"
         return self.spec.match_file(rel_path)
 
+    def match_files(self, rel_paths: list) -> set:
+        """
+        Match a batch of paths against the ignore patterns.
+
+        Args:
+            rel_paths (list): Paths relative to the root folder; directories must
+                carry a trailing "/".
+
+        Returns:
+            set: The subset of rel_paths that is ignored.
+        """
+        return set(self.spec.match_files(rel_paths))
+
 
 class LanguageSpecifier:
     """
@@ -101,6 +137,16 @@ class LanguageSpecifier:
         ".txt": "text",
     }
 
+    BINARY_EXTENSIONS = frozenset(
+        {
+            ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".tif", ".tiff",
+            ".pdf", ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".jar",
+            ".whl", ".so", ".dll", ".dylib", ".exe", ".o", ".a", ".lib", ".bin",
+            ".pyc", ".pyo", ".class", ".wasm", ".mp3", ".mp4", ".wav", ".avi", ".mov",
+            ".ttf", ".otf", ".woff", ".woff2", ".eot", ".sqlite", ".db", ".npy", ".pkl",
+        }
+    )
+
     @classmethod
     def get_language(cls, filename: str) -> str:
         """
@@ -112,8 +158,35 @@ class LanguageSpecifier:
         Returns:
             str: The corresponding language, or an empty string if not found.
         """
-        extension = os.path.splitext(filename)[1].lower()
-        return cls.LANGUAGE_MAP.get(extension, "")
+        return cls._get_extension_language(os.path.splitext(filename)[1])
+
+    @classmethod
+    def is_binary(cls, filename: str) -> bool:
+        """
+        Check whether a file is known to be binary based on its extension.
+
+        Args:
+            filename (str): The file name.
+
+        Returns:
+            bool: True if the extension denotes a binary format.
+        """
+        return os.path.splitext(filename)[1].lower() in cls.BINARY_EXTENSIONS
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_extension_language(cls, extension: str) -> str:
+        """
+        Get the programming language for a file extension. Memoized, since a
+        repository typically only has a handful of distinct extensions.
+
+        Args:
+            extension (str): The file extension including the leading dot.
+
+        Returns:
+            str: The corresponding language, or an empty string if not found.
+        """
+        return cls.LANGUAGE_MAP.get(extension.lower(), "")
 
 
 class DirectoryTree:
@@ -137,50 +210,143 @@ class DirectoryTree:
     def build_tree(self) -> None:
         """
         Build the directory tree by traversing the file system.
-        """
-        self._traverse(self.root_folder, "")
 
-    def _traverse(self, current_path: str, prefix: str) -> None:
+        A single top-down os.walk lists every directory once; ignored
+        directories are pruned before os.walk descends into them.
+        """
+        children = {}
+        rel_prefixes = {self.root_folder: ""}
+        for dir_path, dir_names, file_names in os.walk(self.root_folder, followlinks=True):
+            rel_dir = rel_prefixes[dir_path]
+            ignored = self.ignore_spec.match_files(
+                [rel_dir + name + "/" for name in dir_names]
+                + [rel_dir + name for name in file_names]
+            )
+            dir_names[:] = [name for name in dir_names if rel_dir + name + "/" not in ignored]
+            entries = [(name, True) for name in dir_names]
+            entries.extend((name, False) for name in file_names if rel_dir + name not in ignored)
+            entries.sort()
+            children[dir_path] = entries
+            for name in dir_names:
+                rel_prefixes[os.path.join(dir_path, name)] = rel_dir + name + os.sep
+        self._render(self.root_folder, "", "", children)
+
+    def _render(self, current_path: str, rel_dir: str, prefix: str, children: dict) -> None:
         """
-        Recursively traverse directories to build the tree structure.
+        Recursively render the collected entries into the tree structure.
 
         Args:
             current_path (str): The current directory path.
+            rel_dir (str): The current directory path relative to the root, with a
+                trailing separator (empty for the root).
             prefix (str): The prefix string for formatting the tree.
+            children (dict): Mapping of directory path to its sorted (name, is_dir)
+                entries, as collected by build_tree.
         """
-        entries = sorted(os.listdir(current_path))
-        entries_to_keep = []
-        for entry in entries:
-            entry_path = os.path.join(current_path, entry)
-            if self._should_exclude(entry_path):
-                continue
-            entries_to_keep.append(entry)
-        entries_count = len(entries_to_keep)
-        for idx, entry in enumerate(entries_to_keep):
-            entry_path = os.path.join(current_path, entry)
-            rel_entry = os.path.relpath(entry_path, self.root_folder)
+        entries = children.get(current_path, [])
+        entries_count = len(entries)
+        for idx, (name, is_dir) in enumerate(entries):
+            entry_path = os.path.join(current_path, name)
             is_last = idx == entries_count - 1
             connector = "`-- " if is_last else "|-- "
             new_prefix = prefix + ("    " if is_last else "|   ")
-            self.tree_lines.append(prefix + connector + entry)
-            if os.path.isdir(entry_path):
-                self._traverse(entry_path, new_prefix)
+            self.tree_lines.append(prefix + connector + name)
+            if is_dir:
+                self._render(entry_path, rel_dir + name + os.sep, new_prefix, children)
             else:
-                self.source_files.append((rel_entry, entry_path))
+                self.source_files.append((rel_dir + name, entry_path))
 
-    def _should_exclude(self, entry_path: str) -> bool:
-        """
-        Determine whether to exclude a given path based on ignore specifications.
 
-        Args:
-            entry_path (str): The path to check.
+def _process_one(rel_path: str, full_path: str, interfaces_only: bool) -> tuple:
+    """
+    Read a single file and optionally extract its interfaces.
 
-        Returns:
-            bool: True if the path should be excluded, False otherwise.
-        """
-        if os.path.isdir(entry_path):
-            return self.ignore_spec.is_ignored(entry_path, is_dir=True)
-        return self.ignore_spec.is_ignored(entry_path)
+    Defined at module level so it can be pickled for worker processes.
+
+    Args:
+        rel_path (str): The path relative to the root folder.
+        full_path (str): The full file path.
+        interfaces_only (bool): If True, extract only interfaces for .py files.
+
+    Returns:
+        tuple: (relative_path, {"text": ..., "type": ...}).
+    """
+    file_text = FolderParser._read_file(full_path)
+    return _process_text(rel_path, full_path, file_text, interfaces_only)
+
+
+def _process_text(rel_path: str, full_path: str, file_text: str, interfaces_only: bool) -> tuple:
+    """
+    Detect the language of an already read file and optionally extract its interfaces.
+
+    Args:
+        rel_path (str): The path relative to the root folder.
+        full_path (str): The full file path.
+        file_text (str): The file content.
+        interfaces_only (bool): If True, extract only interfaces for .py files.
+
+    Returns:
+        tuple: (relative_path, {"text": ..., "type": ...}).
+    """
+    file_type = LanguageSpecifier.get_language(full_path)
+    if interfaces_only and file_type == "python":
+        file_text = extract_interfaces(file_text)
+    return rel_path, {"text": file_text, "type": file_type}
+
+
+def _iter_prefetched(source_files: list) -> Iterator[tuple]:
+    """
+    Read files on a thread pool, keeping up to READ_AHEAD reads in flight, and
+    yield them in order. File reads release the GIL, so they overlap with
+    whatever the consumer does between items.
+
+    Args:
+        source_files (list): List of tuples (relative_path, full_path).
+
+    Yields:
+        tuple: (relative_path, full_path, file_text).
+    """
+    files = iter(source_files)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+
+        def submit_next() -> None:
+            item = next(files, None)
+            if item is not None:
+                rel_path, full_path = item
+                future = pool.submit(FolderParser._read_file, full_path)
+                pending.append((rel_path, full_path, future))
+
+        for _ in range(READ_AHEAD):
+            submit_next()
+        while pending:
+            rel_path, full_path, future = pending.popleft()
+            submit_next()
+            yield rel_path, full_path, future.result()
+
+
+def _iter_uring(source_files: list) -> Iterator[tuple]:
+    """
+    Read all files with batched io_uring submissions and yield them in order.
+    Falls back to regular reads for files (or rings) io_uring could not handle.
+
+    Args:
+        source_files (list): List of tuples (relative_path, full_path).
+
+    Yields:
+        tuple: (relative_path, full_path, file_text).
+    """
+    try:
+        contents = uring_reader.read_files([full_path for _, full_path in source_files])
+    except Exception as e:
+        logging.debug(f"io_uring reads unavailable, falling back to threads: {e}")
+        yield from _iter_prefetched(source_files)
+        return
+    for (rel_path, full_path), data in zip(source_files, contents):
+        if data is None:
+            yield rel_path, full_path, FolderParser._read_file(full_path)
+        else:
+            yield rel_path, full_path, FolderParser._decode(data)
 
 
 class FolderParser:
@@ -188,18 +354,27 @@ class FolderParser:
     Parses a folder structure into a dictionary with file details and a folder tree.
     """
 
-    def __init__(self, root_folder: str, interfaces_only: bool = False) -> None:
+    def __init__(
+        self, root_folder: str, interfaces_only: bool = False, max_workers: int = 1
+    ) -> None:
         """
         Initialize the FolderParser.
 
         Args:
             root_folder (str): Path to the root folder.
             interfaces_only (bool, optional): If True, extract only interfaces for .py files.
+            max_workers (int, optional): Number of worker processes used to extract
+                interfaces. Defaults to 1 (no process pool). Values above 1 start a
+                ProcessPoolExecutor, so under the "spawn" start method the calling
+                script must be guarded by ``if __name__ == "__main__"``.
         """
         self.root_folder = root_folder
         self.interfaces_only = interfaces_only
+        self.max_workers = max_workers
         self.parsed_files = {}
         self.folder_tree = []
+        # The root folder name is the same for every file, so compute it once.
+        self._root_name = os.path.basename(root_folder)
         self._parse()
 
     def _parse(self) -> None:
@@ -216,20 +391,104 @@ class FolderParser:
         """
         Parse files from the source list.
 
+        Interface extraction is CPU-bound, so with max_workers > 1 large lists are
+        handed to a process pool in that mode. Otherwise file reads are prefetched
+        on a thread pool.
+
         Args:
             source_files (list): List of tuples (relative_path, full_path).
         """
-        from repo_to_prompt.extract_interfaces import extract_interfaces
-
-        language_specifier = LanguageSpecifier()
+        to_read = []
         for rel_path, full_path in source_files:
-            file_text = self._read_file(full_path)
-            file_type = language_specifier.get_language(full_path)
-            if self.interfaces_only and file_type == "python":
-                interfaces_code = extract_interfaces(file_text)
-                logging.info(f"Extracted interfaces for {rel_path}:\n{interfaces_code}")
-                file_text = interfaces_code
-            self.parsed_files[rel_path] = {"text": file_text, "type": file_type}
+            skipped_text = self._check_skipped(full_path)
+            if skipped_text is None:
+                to_read.append((rel_path, full_path))
+            # Insert every path now so the output keeps the tree order.
+            self.parsed_files[rel_path] = {"text": skipped_text, "type": ""}
+        source_files = to_read
+        if (
+            self.max_workers > 1
+            and self.interfaces_only
+            and len(source_files) >= PARALLEL_MIN_FILES
+        ):
+            try:
+                self._parse_files_parallel(source_files)
+                return
+            except BrokenProcessPool as e:
+                logging.warning(f"Process pool failed ({e}), parsing in this process.")
+        if uring_reader.is_available() and len(source_files) > URING_MIN_FILES:
+            file_iter = _iter_uring(source_files)
+        else:
+            file_iter = _iter_prefetched(source_files)
+        for rel_path, full_path, file_text in file_iter:
+            self._store(*_process_text(rel_path, full_path, file_text, self.interfaces_only))
+
+    def _parse_files_parallel(self, source_files: list) -> None:
+        """
+        Parse files on a pool of max_workers processes.
+
+        Args:
+            source_files (list): List of tuples (relative_path, full_path).
+
+        Raises:
+            BrokenProcessPool: If a worker process dies or cannot be started.
+        """
+        rel_paths = [rel_path for rel_path, _ in source_files]
+        full_paths = [full_path for _, full_path in source_files]
+        flags = [self.interfaces_only] * len(source_files)
+        # executor.map preserves the input order, so the output stays sorted.
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for rel_path, file_info in executor.map(
+                _process_one, rel_paths, full_paths, flags, chunksize=8
+            ):
+                self._store(rel_path, file_info)
+
+    def _store(self, rel_path: str, file_info: dict) -> None:
+        """
+        Store a parsed file. Logging happens here, in the parent process, so it is
+        not lost when the file was processed by a worker.
+
+        Args:
+            rel_path (str): The path relative to the root folder.
+            file_info (dict): The parsed file details ("text" and "type").
+        """
+        if self.interfaces_only and file_info["type"] == "python":
+            logging.info(f"Extracted interfaces for {rel_path}:\n{file_info['text']}")
+        self.parsed_files[rel_path] = file_info
+
+    @staticmethod
+    def _check_skipped(path: str) -> Optional[str]:
+        """
+        Decide, before reading, whether a file is left out of the dump.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            Optional[str]: A placeholder text if the file is too large or has a
+            binary extension, None if it should be read.
+        """
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            # Let the read report the error.
+            return None
+        if size > MAX_FILE_SIZE or LanguageSpecifier.is_binary(path):
+            return FolderParser._skipped_text(size)
+        return None
+
+    @staticmethod
+    def _skipped_text(size: int) -> str:
+        """
+        Return the placeholder text for a file left out of the dump.
+
+        Args:
+            size (int): The file size in bytes.
+
+        Returns:
+            str: The placeholder text.
+        """
+        return f"[Skipped: {size} bytes, binary or too large]"
 
     @staticmethod
     def _read_file(path: str) -> str:
@@ -243,11 +502,57 @@ class FolderParser:
             str: File content or an error message if reading fails.
         """
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                return f.read()
+            # Unbuffered binary read: FileIO.readall sizes its buffer from fstat and
+            # fills it with as few read() calls as possible, then the content is
+            # decoded in a single pass.
+            with open(path, "rb", buffering=0) as f:
+                data = f.read()
+            return FolderParser._decode(data)
         except Exception:
             return "[Error reading file]"
 
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """
+        Decode raw file content the way text mode would.
+
+        Args:
+            data (bytes): The raw file content.
+
+        Returns:
+            str: UTF-8 decoded content with universal newlines, or a placeholder
+            if the content looks binary (contains NUL bytes).
+        """
+        if b"\0" in data[:BINARY_SNIFF_SIZE]:
+            return FolderParser._skipped_text(len(data))
+        text = data.decode("utf-8", errors="replace")
+        # Match text mode's universal newline translation.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def iter_dump(self) -> Iterator[str]:
+        """
+        Lazily yield the pieces of the formatted folder structure.
+
+        The pieces include their separators, so concatenating them gives the same
+        result as dump_to_string, without materializing the whole dump at once.
+
+        Yields:
+            str: The folder tree followed by the header, text and footer of each
+            file source.
+        """
+        yield "* Folder tree *\n\n"
+        yield "\n".join(self.folder_tree)
+        yield "\n\n\n* Sources *\n"
+        # File texts are yielded as-is, between a small header and footer, so they
+        # are never copied into a larger string.
+        file_header = self._file_header
+        for file_path, file_info in self.parsed_files.items():
+            yield "\n" + file_header(file_path, file_info["type"])
+            yield file_info["text"]
+            yield FILE_FOOTER
+
     def dump_to_string(self) -> str:
         """
         Dump the parsed folder structure to a formatted string.
@@ -255,18 +560,19 @@ class FolderParser:
         Returns:
             str: A string containing the folder tree and file sources.
         """
-        output = ["* Folder tree *\n"] + self.folder_tree + ["\n", "* Sources *\n"]
-        root_folder_name = os.path.basename(self.root_folder)
+        # Write into a StringIO instead of joining, so no intermediate list of all
+        # pieces is built; file texts are written directly, never concatenated.
+        buffer = io.StringIO()
+        write = buffer.write
+        write("* Folder tree *\n\n")
+        write("\n".join(self.folder_tree))
+        write("\n\n\n* Sources *\n")
+        root_name = self._root_name
         for file_path, file_info in self.parsed_files.items():
-            output.extend(
-                [
-                    f"** FILE: {root_folder_name}/{file_path} **",
-                    f"```{file_info['type']}",
-                    file_info["text"],
-                    "```\n",
-                ]
-            )
-        return "\n".join(output)
+            write(f"\n** FILE: {root_name}/{file_path} **\n```{file_info['type']}\n")
+            write(file_info["text"])
+            write(FILE_FOOTER)
+        return buffer.getvalue()
 
     def dump_file_to_string(self, file_path: str) -> str:
         """
@@ -278,19 +584,28 @@ class FolderParser:
         Returns:
             str: A formatted string for the file, or an empty string if not found.
         """
-        root_folder_name = os.path.basename(self.root_folder)
         if file_path in self.parsed_files:
             file_info = self.parsed_files[file_path]
-            return "\n".join(
-                [
-                    f"** FILE: {root_folder_name}/{file_path} **",
-                    f"```{file_info['type']}",
-                    file_info["text"],
-                    "```\n",
-                ]
+            return (
+                self._file_header(file_path, file_info["type"])
+                + file_info["text"]
+                + FILE_FOOTER
             )
         return ""
 
+    def _file_header(self, file_path: str, file_type: str) -> str:
+        """
+        Format the header preceding a file's text in the dump.
+
+        Args:
+            file_path (str): The relative file path.
+            file_type (str): The file language.
+
+        Returns:
+            str: The header, ending with the opening code fence.
+        """
+        return f"** FILE: {self._root_name}/{file_path} **\n```{file_type}\n"
+
     def get_all_paths(self) -> list:
         """
         Get all file paths in the parsed folder structure.
@@ -309,7 +624,8 @@ def main() -> None:
     """
     root_folder = sys.argv[1] if len(sys.argv) > 1 else "."
     folder_parser = FolderParser(root_folder)
-    print(folder_parser.dump_to_string())
+    sys.stdout.writelines(folder_parser.iter_dump())
+    sys.stdout.write("\n")
     # print(folder_parser.get_all_paths())
 
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Copyright 2025 by Sergei Belousov
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import sys
+from typing import List, Optional
+
+try:
+    import liburing
+except ImportError:  # Optional dependency: pip install repo_to_prompt[uring]
+    liburing = None
+
+# Number of reads submitted to the ring in one batch.
+QUEUE_DEPTH = 256
+
+
+def is_available() -> bool:
+    """
+    Check whether io_uring based reading can be used on this host.
+
+    Returns:
+        bool: True if the liburing bindings are installed and the platform is Linux.
+    """
+    return liburing is not None and sys.platform.startswith("linux")
+
+
+def read_files(paths: List[str]) -> List[Optional[bytes]]:
+    """
+    Read whole files through io_uring, submitting up to QUEUE_DEPTH reads per batch.
+
+    Args:
+        paths (List[str]): The file paths to read.
+
+    Returns:
+        List[Optional[bytes]]: File contents in the order of paths; None for files
+        that could not be read completely (the caller should fall back to a
+        regular read for those).
+
+    Raises:
+        OSError: If the ring cannot be set up (e.g. io_uring disabled by the kernel).
+    """
+    results = [None] * len(paths)
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(QUEUE_DEPTH, ring)
+    try:
+        for start in range(0, len(paths), QUEUE_DEPTH):
+            _read_batch(ring, cqe, paths, start, results)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return results
+
+
+def _read_batch(ring, cqe, paths: List[str], start: int, results: list) -> None:
+    """
+    Submit reads for paths[start:start + QUEUE_DEPTH] and reap their completions.
+
+    Args:
+        ring: The initialized liburing.Ring.
+        cqe: The liburing.Cqe used to receive completions.
+        paths (List[str]): All file paths.
+        start (int): Index of the first path of this batch.
+        results (list): Output list, filled in place.
+    """
+    fds = []
+    buffers = {}
+    try:
+        for index in range(start, min(start + QUEUE_DEPTH, len(paths))):
+            try:
+                fd = os.open(paths[index], os.O_RDONLY)
+            except OSError:
+                continue
+            fds.append(fd)
+            try:
+                size = os.fstat(fd).st_size
+            except OSError:
+                continue
+            if size == 0:
+                results[index] = b""
+                continue
+            buffer = bytearray(size)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffer, 0)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+            buffers[index] = buffer
+        if not buffers:
+            return
+        liburing.io_uring_submit(ring)
+        for _ in range(len(buffers)):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = liburing.io_uring_cqe_get_data64(entry)
+            try:
+                read = entry.res  # Raises on a failed read.
+            except Exception:
+                read = -1
+            liburing.io_uring_cqe_seen(ring, entry)
+            buffer = buffers[index]
+            if read == len(buffer):
+                results[index] = bytes(buffer)
+    finally:
+        for fd in fds:
+            os.close(fd)
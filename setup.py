@@ -14,11 +14,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import re
+
 from setuptools import setup, find_packages
 
+# Single source of truth for the version: repo_to_prompt/__init__.py (also part of
+# the interface cache key).
+with open("repo_to_prompt/__init__.py", encoding="utf-8") as f:
+    version = re.search(r'^__version__ = "([^"]+)"', f.read(), re.MULTILINE).group(1)
+
 setup(
     name='repo_to_prompt',
-    version='0.1.0',
+    version=version,
     description='A tool to convert repo to prompt',
     author='Sergei Belousov aka BeS',
     author_email='sergei.o.belousov@gmail.com',
@@ -29,6 +36,9 @@ setup(
     install_requires=[
         'pathspec'
     ],
+    extras_require={
+        'uring': ['liburing'],
+    },
     entry_points={
         'console_scripts': [
             'repo_to_prompt = repo_to_prompt.cli:main',